@@ -6,25 +6,41 @@ and attributes, then computing precision, recall, and F1-score metrics.
 
 Usage:
     python compare_plantuml_models.py <reference.puml> <model1.puml> <model2.puml> [--output results.json]
+
+Requires Python 3.10 or later (the result dataclasses use slots=True).
 """
 
-import argparse
-import json
+import functools
+import mmap
+import os
 import re
+import stat
+import string
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Set
+
+
+# Relationships and attributes are stored as single interned strings joining their
+# normalized parts with KEY_SEPARATOR, which never appears in a normalized identifier.
+# Their hashes are cached, unlike tuple hashes, which speeds up the set operations.
+KEY_SEPARATOR = '\0'
 
+# Models are parsed in worker processes only when the files add up to this many bytes;
+# for smaller inputs, starting workers takes longer than parsing the models one by one
+PARALLEL_MIN_BYTES = 1 << 20
 
-@dataclass
+
+@dataclass(slots=True)
 class ModelElements:
     """Holds extracted elements from a PlantUML model."""
     classes: Set[str] = field(default_factory=set)
-    relationships: Set[Tuple[str, str, str]] = field(default_factory=set) 
-    attributes: Set[Tuple[str, str]] = field(default_factory=set)
+    relationships: Set[str] = field(default_factory=set)  # "source\0type\0target"
+    attributes: Set[str] = field(default_factory=set)  # "class\0attribute"
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricResult:
     """Holds precision, recall, and F1 metrics."""
     precision: float
@@ -33,8 +49,152 @@ class MetricResult:
     true_positives: int
     false_positives: int
     false_negatives: int
+    
+    def to_dict(self) -> Dict:
+        """Return the metrics as a JSON-ready dict, with ratios rounded to 4 decimals."""
+        return {
+            "precision": round(self.precision, 4),
+            "recall": round(self.recall, 4),
+            "f1_score": round(self.f1_score, 4),
+            "true_positives": self.true_positives,
+            "false_positives": self.false_positives,
+            "false_negatives": self.false_negatives
+        }
+
+
+# Identifier characters, used inside character classes
+WORD = r'\w'
+
+# Relationship patterns: ClassA --> ClassB, ClassA -- ClassB, ClassA --|> ClassB, etc.
+# Optional cardinality: ClassA "1" *-- "1..*" ClassB : label
+# CARD matches optional quoted cardinality like "1" or "1..*"
+# A relationship is a single line, so only whitespace other than a newline (SPACE) is
+# allowed between its parts. With \s a quoted right-hand class could be taken as a
+# cardinality and the next line's class as the endpoint, losing that line's relationship.
+SPACE = r'[^\S\n]*'
+CARD = rf'(?:{SPACE}"[^"\n]*")?'  # optional cardinality e.g. "1", "1..*", "0..1"
+LABEL = rf'(?:{SPACE}:{SPACE}[^\n]+)?'  # optional label e.g. ": uses"
+# CLASS matches either a quoted name or a simple/qualified identifier.
+# {side} prefixes the group names so the pattern can be used more than once.
+CLASS = r'(?:"(?P<{side}_quoted>[^"]+)"|(?P<{side}_name>[' + WORD + r'.]+))'
+
+# Relationship types, already in normalized form and interned like the identifiers
+# returned by normalize_identifier, so they are used as-is
+INHERITANCE, REALIZATION, COMPOSITION, AGGREGATION, ASSOCIATION, DEPENDENCY = map(sys.intern, (
+    'inheritance', 'realization', 'composition', 'aggregation', 'association', 'dependency'
+))
+
+# Each arrow operator maps to: (relationship_type, is_reverse)
+# is_reverse=True means the arrow points left, so source/target must be swapped
+# Example: A <|-- B means B inherits from A, so source=B, target=A
+RELATIONSHIP_OPERATORS = {
+    '<|--': (INHERITANCE, True),    # inheritance (reverse)
+    '--|>': (INHERITANCE, False),   # inheritance
+    '<|..': (REALIZATION, True),    # realization (reverse)
+    '..|>': (REALIZATION, False),   # realization
+    '*--': (COMPOSITION, True),     # composition (diamond on left)
+    '--*': (COMPOSITION, False),    # composition (diamond on right)
+    'o--': (AGGREGATION, True),     # aggregation (diamond on left)
+    '--o': (AGGREGATION, False),    # aggregation (diamond on right)
+    '-->': (ASSOCIATION, False),    # directed association
+    '<--': (ASSOCIATION, True),     # directed association (reverse)
+    '--': (ASSOCIATION, False),     # association (undirected)
+    '..>': (DEPENDENCY, False),     # dependency
+    '<..': (DEPENDENCY, True),      # dependency (reverse)
+}
+
+# All arrow operators combined into one alternation, so relationships are found in a
+# single scan instead of one scan per arrow type. The undirected '--' keeps its
+# lookarounds to exclude the special arrows above.
+ARROW = r'(?P<op><\|--|--\|>|<\|\.\.|\.\.\|>|\*--|--\*|o--|--o|-->|<--|(?<![<|*o])--(?![>|*o])|\.\.>|<\.\.)'
 
+# Comments: ' starts a line comment, /* ... */ is a block comment.
+# Both can only match one way: a line comment always runs to the end of its line and a
+# block comment to its first */, so patterns built from them cannot backtrack into them.
+LINE_COMMENT = r"'[^\n]*(?![^\n])"
+BLOCK_COMMENT = r"/\*[^*]*\*+(?:[^/*][^*]*\*+)*/"
+COMMENT = f"{LINE_COMMENT}|{BLOCK_COMMENT}"
+# Class body up to the closing brace. Comments are skipped as a whole, so a brace
+# inside a comment does not end the body; any other slash is plain text. The
+# alternatives exclude each other, so a body that is never closed fails in linear time.
+# (parse_plantuml_file splits a /* that is never closed, so every /* here is closed.)
+BODY = r"(?P<body>[^}'/]*(?:(?:" + COMMENT + r"|/(?!\*))[^}'/]*)*)"
 
+# Class definitions with a body: class ClassName { attribute_name }
+# Handles: class Name, class "Quoted Name", class qualified.Name, optionally followed by "as Alias"
+CLASS_DEF = (
+    rf'(?P<class_def>(?i:class|abstract\s+class|interface)\s+{CLASS.format(side="def")}'
+    rf'(?:\s+(?i:as)\s+(?P<def_alias>[{WORD}]+))?\s*\{{{BODY}\}})'
+)
+# Class declarations: class ClassName, abstract class ClassName, interface ClassName, enum ClassName
+# Also handles: class "Quoted Name" as Alias, class Name as Alias, class "Quoted Name"
+CLASS_DECL = (
+    rf'(?P<class_decl>(?i:class|abstract\s+class|interface|enum)\s+{CLASS.format(side="decl")}'
+    rf'(?:\s+(?i:as)\s+[{WORD}]+)?)'
+)
+# The left class name may only start at the beginning of a word. Starting inside a word
+# can never produce a match that the word start would not (the name is matched greedily
+# and backtracks), so this just stops the scan from retrying every character of every word.
+LEFT_CLASS = rf'(?:"(?P<left_quoted>[^"]+)"|(?<![{WORD}.])(?P<left_name>[{WORD}.]+))'
+RELATIONSHIP = (
+    rf'(?P<relationship>{LEFT_CLASS}{CARD}{SPACE}{ARROW}'
+    rf'{CARD}{SPACE}{CLASS.format(side="right")}{LABEL})'
+)
+
+# Characters an element can start with: comment markers, a quoted name or an
+# identifier. Checked once per position as a cheap pre-filter, so whitespace and
+# punctuation (most of a PlantUML file) are skipped without trying every alternative.
+ELEMENT_START = rf'(?=[\'/"{WORD}.])'
+
+# Every element kind in one alternation, so the content is scanned once.
+# The outermost named group of a match (match.lastgroup) tells which kind was found.
+# Comments are matched so that commented-out elements are skipped without rewriting
+# the content. Class definitions come before declarations so a class with a body is
+# not taken as a bare declaration.
+ELEMENTS = '|'.join((rf'(?P<comment>{COMMENT})', CLASS_DEF, CLASS_DECL, RELATIONSHIP))
+ELEMENT_PATTERN = re.compile(f'{ELEMENT_START}(?:{ELEMENTS})')
+# The same pattern for raw file bytes, used on files that need no decoding. On bytes \w
+# and \s only cover ASCII, and str \s also matches the \x1c-\x1f separators, so files
+# containing any byte in TEXT_ONLY_BYTES_PATTERN are decoded and scanned as str instead.
+ELEMENT_BYTES_PATTERN = re.compile(ELEMENT_PATTERN.pattern.encode('ascii'))
+TEXT_ONLY_BYTES_PATTERN = re.compile(rb'[\x1c-\x1f\x80-\xff]')
+# Used on decoded class bodies
+COMMENT_PATTERN = re.compile(COMMENT)
+
+
+# Attribute line inside a class body:
+#   [{modifier}] [visibility [{modifier}]] name [{modifier}] [: type] [= default] ['comment]
+# visibility: +, -, #, ~
+# Anchored to only capture the attribute name, not type names. Lines with a parenthesis
+# (methods) are skipped before matching. Each part starts with its own character ({, a
+# visibility sign, : or =, '), so a line that does not match fails without trying
+# every way of splitting it between the parts.
+ATTRIBUTE_PATTERN = re.compile(r"""
+    ^(?!\s*\{[^']*\}\s*(?:'|$))                                # not a stereotype-only line like {abstract}
+    \s*
+    (?:\{[^}']+\}\s*)*                                         # leading stereotype/modifier like {static} or {abstract}
+    (?:[+\-\#~]\s*(?:\{[^}']+\}\s*)*)?                         # visibility, optionally followed by a modifier
+    (\w+)                                                      # attribute name
+    (?:\s*\{[^}']+\})*                                         # trailing modifier like {readonly}
+    (?:\s*[:=](?:\s*\{[^}']+\})*\s*(?!\{[^}']+\})[^\s'][^']*)? # type and/or default value
+    \s*(?:'.*)?$                                               # inline comment (PlantUML uses ' for comments)
+""", re.VERBOSE)
+# Keywords that can appear where an attribute name is expected
+ATTRIBUTE_MODIFIERS = frozenset(('static', 'abstract', 'final', 'const', 'readonly', 'virtual', 'override'))
+
+
+# Translation table used by normalize_identifier for ASCII input: uppercase letters
+# map to lowercase, everything other than letters and digits is deleted
+ASCII_NORMALIZE_TABLE = str.maketrans(
+    string.ascii_uppercase,
+    string.ascii_lowercase,
+    ''.join(chr(c) for c in range(128) if not chr(c).isalnum())
+)
+# Matches anything that is not a letter or digit (whitespace, underscores, punctuation)
+NON_ALNUM_PATTERN = re.compile(r'[\W_]+')
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_identifier(identifier: str) -> str:
     """
     Normalize an identifier by:
@@ -51,22 +211,36 @@ def normalize_identifier(identifier: str) -> str:
     if not identifier:
         return ""
     
-    # Remove leading/trailing whitespace
-    identifier = identifier.strip()
-    
-    # Remove special characters except underscores (keep for snake_case detection)
-    identifier = re.sub(r'[^\w\s]', '', identifier)
-    
-    # Convert to lowercase
-    identifier = identifier.lower()
-    
-    # Remove all whitespace
-    identifier = re.sub(r'\s+', '', identifier)
+    # ASCII fast path: lowercase and drop everything but letters and digits in one pass
+    if identifier.isascii():
+        normalized = identifier.translate(ASCII_NORMALIZE_TABLE)
+    else:
+        # Remove whitespace, underscores and special characters, then lowercase.
+        # Lowercasing happens last so characters produced by it are kept, as before.
+        normalized = NON_ALNUM_PATTERN.sub('', identifier).lower()
+    
+    # Intern so equal identifiers share one object across classes, relationships and
+    # attributes, which keeps the element sets small and their comparisons fast
+    return sys.intern(normalized)
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize_class_name(raw_name: str) -> str:
+    """
+    Normalize a class name, dropping any package prefix (e.g. "pkg.sub.Name" -> "name").
     
-    # Canonicalize by removing underscores (converts snake_case to a standard form)
-    identifier = identifier.replace('_', '')
+    Class names recur as relationship endpoints and attribute owners, so results
+    are cached alongside normalize_identifier.
     
-    return identifier
+    Args:
+        raw_name: The class name as written in the model, possibly qualified
+        
+    Returns:
+        Normalized simple class name
+    """
+    # Extract just the class name (last part if qualified); rpartition returns the
+    # whole name when there is no dot, without building a list
+    return normalize_identifier(raw_name.rpartition('.')[2])
 
 
 def parse_plantuml_file(file_path: Path) -> ModelElements:
@@ -81,159 +255,124 @@ def parse_plantuml_file(file_path: Path) -> ModelElements:
     """
     elements = ModelElements()
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Remove comments
-    content = re.sub(r"'.*?$", '', content, flags=re.MULTILINE)
-    content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-    
-    # Extract classes (considering various PlantUML syntaxes)
-    # Match: class ClassName, abstract class ClassName, interface ClassName, enum ClassName
-    # Also handles: class "Quoted Name" as Alias, class Name as Alias, class "Quoted Name"
-    # Group 1: quoted name (optional)
-    # Group 2: simple/qualified name (optional)
-    # Group 3: alias (optional)
-    class_pattern = r'(?:class|abstract\s+class|interface|enum)\s+(?:"([^"]+)"|([\w.]+))(?:\s+as\s+(\w+))?'
+    mapped = None
+    with open(file_path, 'rb') as f:
+        file_stat = os.fstat(f.fileno())
+        if stat.S_ISREG(file_stat.st_mode):
+            # Empty files cannot be memory-mapped (and contain no elements)
+            if file_stat.st_size == 0:
+                return elements
+            # Scan the mapped bytes directly instead of reading the whole file
+            mapped = content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            # Pipes and other special files report no usable size and cannot be mapped
+            content = f.read()
     
-    for match in re.finditer(class_pattern, content, re.IGNORECASE):
-        quoted_name = match.group(1)
-        simple_name = match.group(2)
-        
-        # Determine the raw class name (without namespace prefix)
-        raw_name = quoted_name if quoted_name else simple_name
-        
-        # Extract just the class name (last part if qualified)
-        simple_class_name = raw_name.split('.')[-1] if '.' in raw_name else raw_name
-        
-        # Normalize the simple class name for storage (ignoring package hierarchy)
-        normalized_class = normalize_identifier(simple_class_name)
+    try:
+        # Translate \r\n and lone \r line endings to \n, as reading in text mode did
+        if content.find(b'\r') != -1:
+            content = content[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
         
-        if normalized_class:
-            elements.classes.add(normalized_class)
-    
-    # Extract relationships (various types)
-    # Patterns: ClassA --> ClassB, ClassA -- ClassB, ClassA -|> ClassB, etc.
-    # Optional cardinality: ClassA "1" *-- "1..*" ClassB : label
-    # CARD matches optional quoted cardinality like "1" or "1..*"
-    CARD = r'(?:\s*"[^"]*")?'  # optional cardinality e.g. "1", "1..*", "0..1"
-    LABEL = r'(?:\s*:\s*[^\n]+)?'  # optional label e.g. ": uses"
-    # CLASS matches either a quoted name or a simple/qualified identifier
-    CLASS = r'(?:"([^"]+)"|([\w.]+))'
-    
-    # Each pattern tuple: (regex, relationship_type, is_reverse)
-    # is_reverse=True means the arrow points left, so source/target must be swapped
-    # Example: A <|-- B means B inherits from A, so source=B, target=A
-    relationship_patterns = [
-        (rf'{CLASS}{CARD}\s*(<\|--){CARD}\s*{CLASS}{LABEL}', 'inheritance', True),   # inheritance (reverse)
-        (rf'{CLASS}{CARD}\s*(--\|>){CARD}\s*{CLASS}{LABEL}', 'inheritance', False),  # inheritance
-        (rf'{CLASS}{CARD}\s*(<\|\.\.){CARD}\s*{CLASS}{LABEL}', 'realization', True), # realization (reverse)
-        (rf'{CLASS}{CARD}\s*(\.\.\|>){CARD}\s*{CLASS}{LABEL}', 'realization', False), # realization
-        (rf'{CLASS}{CARD}\s*(\*--){CARD}\s*{CLASS}{LABEL}', 'composition', True),    # composition (diamond on left)
-        (rf'{CLASS}{CARD}\s*(--\*){CARD}\s*{CLASS}{LABEL}', 'composition', False),   # composition (diamond on right)
-        (rf'{CLASS}{CARD}\s*(o--){CARD}\s*{CLASS}{LABEL}', 'aggregation', True),     # aggregation (diamond on left)
-        (rf'{CLASS}{CARD}\s*(--o){CARD}\s*{CLASS}{LABEL}', 'aggregation', False),    # aggregation (diamond on right)
-        (rf'{CLASS}{CARD}\s*(-->){CARD}\s*{CLASS}{LABEL}', 'association', False),    # directed association
-        (rf'{CLASS}{CARD}\s*(<--){CARD}\s*{CLASS}{LABEL}', 'association', True),     # directed association (reverse)
-        (rf'{CLASS}{CARD}\s*((?<![<|*o])--(?![>|*o])){CARD}\s*{CLASS}{LABEL}', 'association', False),  # association (undirected, exclude special arrows)
-        (rf'{CLASS}{CARD}\s*(\.\.>){CARD}\s*{CLASS}{LABEL}', 'dependency', False),   # dependency
-        (rf'{CLASS}{CARD}\s*(<\.\.){CARD}\s*{CLASS}{LABEL}', 'dependency', True),    # dependency (reverse)
-    ]
-    
-    for pattern, rel_type, is_reverse in relationship_patterns:
-        for match in re.finditer(pattern, content):
-            # CLASS pattern has 2 groups: (quoted_name, simple_name)
-            # Left class is groups 1,2; operator is group 3; right class is groups 4,5
-            left_quoted = match.group(1)
-            left_simple = match.group(2)
-            right_quoted = match.group(4)
-            right_simple = match.group(5)
-            
-            left_name = left_quoted if left_quoted else left_simple
-            right_name = right_quoted if right_quoted else right_simple
-            
-            # Extract just the class name (last part if qualified), ignoring package
-            left = normalize_identifier(left_name.split('.')[-1] if '.' in left_name else left_name)
-            right = normalize_identifier(right_name.split('.')[-1] if '.' in right_name else right_name)
-            
-            if left and right:
-                # Swap source/target for reverse arrows to normalize direction
-                if is_reverse:
-                    source, target = right, left
-                else:
-                    source, target = left, right
-                # Normalize relationship type
-                normalized_rel = normalize_identifier(rel_type)
-                elements.relationships.add((source, normalized_rel, target))
-    
-    # Extract attributes from class definitions
-    # Pattern: class ClassName { attribute_name }
-    # Handles: class Name, class "Quoted Name", class qualified.Name
-    class_def_pattern = r'(?:class|abstract\s+class|interface)\s+(?:"([^"]+)"|([\w.]+))(?:\s+as\s+(\w+))?\s*\{([^}]*)\}'
-    for match in re.finditer(class_def_pattern, content, re.IGNORECASE | re.DOTALL):
-        quoted_name = match.group(1)
-        simple_name = match.group(2)
-        alias = match.group(3)
-        attributes_block = match.group(4)
+        # A /* that is never closed is plain text, as it was when comments were stripped
+        # before parsing. Those all come after the last */; they are split into '/ *' so the
+        # scanner does not retry each of them as a comment, which scans to the end of the file.
+        # Names are normalized to letters and digits, so the extra space changes no element.
+        last_close = content.rfind(b'*/')
+        first_unclosed = content.find(b'/*', max(last_close - 1, 0))
+        if first_unclosed != -1:
+            content = content[:first_unclosed] + content[first_unclosed:].replace(b'/*', b'/ *')
         
-        # Get the simple class name (ignore package hierarchy)
-        if alias:
-            raw_name = alias
-        elif quoted_name:
-            raw_name = quoted_name
+        # Files with non-ASCII text are decoded and scanned as str. Pure ASCII files are
+        # scanned as bytes, and only the matched parts are decoded.
+        if TEXT_ONLY_BYTES_PATTERN.search(content):
+            content = content[:].decode('utf-8')
+            element_pattern = ELEMENT_PATTERN
+            decode = str
         else:
-            raw_name = simple_name
+            element_pattern = ELEMENT_BYTES_PATTERN
+            decode = bytes.decode
         
-        # Extract just the class name (last part if qualified)
-        simple_class_name = raw_name.split('.')[-1] if '.' in raw_name else raw_name
-        class_name = normalize_identifier(simple_class_name)
-        
-        # Process each line separately to avoid matching type names or method parts
-        for line in attributes_block.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
+        # Extract classes, relationships and attributes in a single pass over the content
+        for match in element_pattern.finditer(content):
+            kind = match.lastgroup
             
-            # Remove inline comments (PlantUML uses ' for comments)
-            line = re.sub(r"'.*$", '', line).strip()
-            if not line:
+            if kind == 'comment':
                 continue
             
-            # Skip methods (lines containing parentheses)
-            if '(' in line:
+            if kind == 'relationship':
+                left_quoted = match.group('left_quoted')
+                left_simple = match.group('left_name')
+                right_quoted = match.group('right_quoted')
+                right_simple = match.group('right_name')
+                rel_type, is_reverse = RELATIONSHIP_OPERATORS[decode(match.group('op'))]
+                
+                left_name = decode(left_quoted if left_quoted else left_simple)
+                right_name = decode(right_quoted if right_quoted else right_simple)
+                
+                # Extract just the class name (last part if qualified), ignoring package
+                left = normalize_class_name(left_name)
+                right = normalize_class_name(right_name)
+                
+                if left and right:
+                    # Swap source/target for reverse arrows to normalize direction
+                    if is_reverse:
+                        source, target = right, left
+                    else:
+                        source, target = left, right
+                    elements.relationships.add(sys.intern(KEY_SEPARATOR.join((source, rel_type, target))))
                 continue
             
-            # Skip stereotypes/modifiers like {abstract}, {static}, {field}, etc.
-            if re.match(r'^\{.*\}$', line):
-                continue
+            if kind == 'class_def':
+                quoted_name = match.group('def_quoted')
+                simple_name = match.group('def_name')
+            else:
+                quoted_name = match.group('decl_quoted')
+                simple_name = match.group('decl_name')
             
-            # Skip annotation lines (starting with @)
-            if line.startswith('@'):
-                continue
+            # Determine the raw class name (without namespace prefix)
+            raw_name = decode(quoted_name if quoted_name else simple_name)
             
-            # Skip separator lines (-- or ==)
-            if re.match(r'^[-=]+$', line):
-                continue
+            # Normalize the simple class name for storage (ignoring package hierarchy)
+            normalized_class = normalize_class_name(raw_name)
+            
+            if normalized_class:
+                elements.classes.add(normalized_class)
             
-            # Remove leading stereotype/modifier like {static} or {abstract}
-            line = re.sub(r'\{[^}]+\}\s*', '', line).strip()
-            if not line:
+            if kind != 'class_def':
                 continue
             
-            # Match attribute pattern: [visibility] name : type [= default]
-            # visibility: +, -, #, ~
-            # Anchored regex to only capture the attribute name, not type names
-            attr_match = re.match(r'^[+\-#~]?\s*(\w+)\s*(?::\s*.+)?(?:\s*=\s*.+)?$', line)
-            if attr_match:
-                attr_name = attr_match.group(1).strip()
+            # Attributes are attached to the alias when one is given
+            alias = match.group('def_alias')
+            class_name = normalize_class_name(decode(alias)) if alias else normalized_class
+            attributes_block = decode(match.group('body'))
+            
+            # Inline ' comments are handled per line; block comments may span lines
+            if '/*' in attributes_block:
+                attributes_block = COMMENT_PATTERN.sub('', attributes_block)
+            
+            # Process each line separately to avoid matching type names or method parts.
+            # Comments, stereotype-only, annotation and separator lines fail the match.
+            for line in attributes_block.split('\n'):
+                # Skip methods (lines with parentheses outside the inline comment)
+                if '(' in line.partition("'")[0]:
+                    continue
+                
+                attr_match = ATTRIBUTE_PATTERN.match(line)
+                if not attr_match:
+                    continue
+                
+                attr_name = attr_match.group(1)
                 
                 # Skip if the "attribute" is actually a modifier keyword
-                if attr_name.lower() in ('static', 'abstract', 'final', 'const', 'readonly', 'virtual', 'override'):
+                if attr_name.lower() in ATTRIBUTE_MODIFIERS:
                     continue
                 
                 normalized_attr = normalize_identifier(attr_name)
                 if normalized_attr and class_name:
-                    elements.attributes.add((class_name, normalized_attr))
+                    elements.attributes.add(sys.intern(KEY_SEPARATOR.join((class_name, normalized_attr))))
+    finally:
+        if mapped is not None:
+            mapped.close()
     
     return elements
 
@@ -253,6 +392,21 @@ def calculate_metrics(reference: Set, evaluated: Set) -> MetricResult:
     fp = len(evaluated - reference)  # False Positives
     fn = len(reference - evaluated)  # False Negatives
     
+    return metrics_from_counts(tp, fp, fn)
+
+
+def metrics_from_counts(tp: int, fp: int, fn: int) -> MetricResult:
+    """
+    Calculate precision, recall, and F1-score from true/false positive and false negative counts.
+    
+    Args:
+        tp: Number of true positives
+        fp: Number of false positives
+        fn: Number of false negatives
+        
+    Returns:
+        MetricResult with calculated metrics
+    """
     precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
     recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
     f1_score = (2 * precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
@@ -267,13 +421,46 @@ def calculate_metrics(reference: Set, evaluated: Set) -> MetricResult:
     )
 
 
-def compare_models(reference_path: Path, model_paths: List[Path]) -> Dict:
+def format_relationships(keys: List[str]) -> List[str]:
+    """
+    Format relationship keys as "source -type-> target" strings.
+    
+    Identifiers never contain characters that sort below the separator, so
+    callers can sort the raw keys and get the same order as the formatted strings.
+    
+    Args:
+        keys: Relationship keys ("source\\0type\\0target")
+        
+    Returns:
+        List of formatted relationships, in the order given
+    """
+    return [f"{s} -{t}-> {d}" for s, t, d in (key.split(KEY_SEPARATOR) for key in keys)]
+
+
+def format_attributes(keys: List[str]) -> List[str]:
+    """
+    Format attribute keys as "class.attribute" strings.
+    
+    Args:
+        keys: Attribute keys ("class\\0attribute")
+        
+    Returns:
+        List of formatted attributes, in the order given
+    """
+    return [key.replace(KEY_SEPARATOR, '.') for key in keys]
+
+
+def compare_models(reference_path: Path, model_paths: List[Path],
+                   include_differences: bool = True) -> Dict:
     """
     Compare multiple PlantUML models against a reference model.
     
     Args:
         reference_path: Path to the reference PlantUML model
         model_paths: List of paths to models to compare
+        include_differences: Whether to include the sorted missing/extra element lists;
+            callers that only need the metrics can skip them (print_results then
+            leaves out the differences summary)
         
     Returns:
         Dictionary containing comparison results
@@ -291,19 +478,35 @@ def compare_models(reference_path: Path, model_paths: List[Path]) -> Dict:
         "comparisons": []
     }
     
-    # Compare each model
-    for model_path in model_paths:
-        model = parse_plantuml_file(model_path)
+    # Parse large model sets in worker processes: parsing is CPU-bound and independent per file
+    max_workers = min(len(model_paths), os.cpu_count() or 1)
+    model_bytes = sum(os.stat(model_path).st_size for model_path in model_paths)
+    if max_workers > 1 and model_bytes >= PARALLEL_MIN_BYTES:
+        # Imported here: loading multiprocessing takes longer than parsing a small model
+        from concurrent.futures import ProcessPoolExecutor
         
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            models = list(executor.map(parse_plantuml_file, model_paths))
+    else:
+        models = [parse_plantuml_file(model_path) for model_path in model_paths]
+    
+    # Compare each model
+    for model_path, model in zip(model_paths, models):
         # Calculate metrics for each element type
         class_metrics = calculate_metrics(reference.classes, model.classes)
         relationship_metrics = calculate_metrics(reference.relationships, model.relationships)
         attribute_metrics = calculate_metrics(reference.attributes, model.attributes)
         
-        # Calculate overall metrics (micro-average across all elements)
-        all_reference = reference.classes | reference.relationships | reference.attributes
-        all_model = model.classes | model.relationships | model.attributes
-        overall_metrics = calculate_metrics(all_reference, all_model)
+        # Calculate overall metrics (micro-average across all elements).
+        # Element types never overlap (classes have no separator, relationships two and
+        # attributes one), so the counts for the union of all elements are the sums of
+        # the per-type counts.
+        category_metrics = (class_metrics, relationship_metrics, attribute_metrics)
+        overall_metrics = metrics_from_counts(
+            sum(m.true_positives for m in category_metrics),
+            sum(m.false_positives for m in category_metrics),
+            sum(m.false_negatives for m in category_metrics)
+        )
         
         comparison = {
             "model_path": str(model_path),
@@ -313,49 +516,23 @@ def compare_models(reference_path: Path, model_paths: List[Path]) -> Dict:
                 "attributes": len(model.attributes)
             },
             "metrics": {
-                "classes": {
-                    "precision": round(class_metrics.precision, 4),
-                    "recall": round(class_metrics.recall, 4),
-                    "f1_score": round(class_metrics.f1_score, 4),
-                    "true_positives": class_metrics.true_positives,
-                    "false_positives": class_metrics.false_positives,
-                    "false_negatives": class_metrics.false_negatives
-                },
-                "relationships": {
-                    "precision": round(relationship_metrics.precision, 4),
-                    "recall": round(relationship_metrics.recall, 4),
-                    "f1_score": round(relationship_metrics.f1_score, 4),
-                    "true_positives": relationship_metrics.true_positives,
-                    "false_positives": relationship_metrics.false_positives,
-                    "false_negatives": relationship_metrics.false_negatives
-                },
-                "attributes": {
-                    "precision": round(attribute_metrics.precision, 4),
-                    "recall": round(attribute_metrics.recall, 4),
-                    "f1_score": round(attribute_metrics.f1_score, 4),
-                    "true_positives": attribute_metrics.true_positives,
-                    "false_positives": attribute_metrics.false_positives,
-                    "false_negatives": attribute_metrics.false_negatives
-                },
-                "overall": {
-                    "precision": round(overall_metrics.precision, 4),
-                    "recall": round(overall_metrics.recall, 4),
-                    "f1_score": round(overall_metrics.f1_score, 4),
-                    "true_positives": overall_metrics.true_positives,
-                    "false_positives": overall_metrics.false_positives,
-                    "false_negatives": overall_metrics.false_negatives
-                }
-            },
-            "differences": {
-                "missing_classes": sorted(list(reference.classes - model.classes)),
-                "extra_classes": sorted(list(model.classes - reference.classes)),
-                "missing_relationships": sorted([f"{s} -{t}-> {d}" for s, t, d in (reference.relationships - model.relationships)]),
-                "extra_relationships": sorted([f"{s} -{t}-> {d}" for s, t, d in (model.relationships - reference.relationships)]),
-                "missing_attributes": sorted([f"{c}.{a}" for c, a in (reference.attributes - model.attributes)]),
-                "extra_attributes": sorted([f"{c}.{a}" for c, a in (model.attributes - reference.attributes)])
+                "classes": class_metrics.to_dict(),
+                "relationships": relationship_metrics.to_dict(),
+                "attributes": attribute_metrics.to_dict(),
+                "overall": overall_metrics.to_dict()
             }
         }
         
+        if include_differences:
+            comparison["differences"] = {
+                "missing_classes": sorted(reference.classes - model.classes),
+                "extra_classes": sorted(model.classes - reference.classes),
+                "missing_relationships": format_relationships(sorted(reference.relationships - model.relationships)),
+                "extra_relationships": format_relationships(sorted(model.relationships - reference.relationships)),
+                "missing_attributes": format_attributes(sorted(reference.attributes - model.attributes)),
+                "extra_attributes": format_attributes(sorted(model.attributes - reference.attributes))
+            }
+        
         results["comparisons"].append(comparison)
     
     return results
@@ -401,8 +578,10 @@ def print_results(results: Dict):
         print("  " + "-" * 76)
         print()
         
-        # Print differences summary
-        diffs = comp["differences"]
+        # Print differences summary, when the comparison includes the differences
+        diffs = comp.get("differences")
+        if diffs is None:
+            continue
         print("  Differences Summary:")
         print(f"    Missing Classes: {len(diffs['missing_classes'])}")
         print(f"    Extra Classes: {len(diffs['extra_classes'])}")
@@ -415,6 +594,10 @@ def print_results(results: Dict):
 
 def main():
     """Main entry point for the script."""
+    # Only needed on the command line, not when imported by the table generators
+    import argparse
+    import json
+    
     parser = argparse.ArgumentParser(
         description="Compare PlantUML class diagram models",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -426,6 +609,9 @@ def main():
                 # Save results to JSON file
                 python compare_plantuml_models.py reference.puml model1.puml model2.puml --output results.json
                 
+                # Only save results to JSON file, without printing the summary
+                python compare_plantuml_models.py reference.puml model1.puml model2.puml --output results.json --quiet
+                
                 # Compare models in the data folder
                 python compare_plantuml_models.py data/reference.puml data/model1.puml data/model2.puml
         """
@@ -456,6 +642,12 @@ def main():
         help="Show detailed differences"
     )
     
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Do not print the results summary (useful with --output)"
+    )
+    
     args = parser.parse_args()
     
     # Validate files exist
@@ -472,8 +664,15 @@ def main():
     print(f"Comparing {len(args.models)} model(s) against reference...")
     results = compare_models(args.reference, args.models)
     
+    # Save to JSON first, so scripted runs get the file before any console output
+    if args.output:
+        # Serialize in one call and write once; json.dump would issue a write per token
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(results, indent=2))
+    
     # Print results
-    print_results(results)
+    if not args.quiet:
+        print_results(results)
     
     # Show detailed differences if verbose
     if args.verbose:
@@ -512,10 +711,7 @@ def main():
                 for attr in diffs["extra_attributes"]:
                     print(f"  + {attr}")
     
-    # Save to JSON if requested
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2)
         print(f"\nResults saved to: {args.output}")
     
     return 0
@@ -17,13 +17,13 @@ Examples:
         --scored-model paper_data/llm-mas/run_1/scored_terms.csv
 """
 
-import argparse
 import csv
-import json
 import re
+import string
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, List, Set
 
 
 @dataclass
@@ -40,6 +40,17 @@ class MetricResult:
     fn_terms: Set[str]
 
 
+# Translation table used by normalize_term for ASCII input: uppercase letters
+# map to lowercase, everything other than letters and digits is deleted
+ASCII_NORMALIZE_TABLE = str.maketrans(
+    string.ascii_uppercase,
+    string.ascii_lowercase,
+    ''.join(chr(c) for c in range(128) if not chr(c).isalnum())
+)
+# Everything normalize_term drops: whitespace, punctuation and underscores
+NON_ALNUM_PATTERN = re.compile(r'[\W_]+')
+
+
 def normalize_term(term: str) -> str:
     """
     Normalize a term by:
@@ -56,60 +67,70 @@ def normalize_term(term: str) -> str:
     if not term:
         return ""
     
-    # Remove leading/trailing whitespace
-    term = term.strip()
-    
-    # Remove special characters except underscores (temporarily keep for snake_case detection)
-    term = re.sub(r'[^\w\s]', '', term)
-    
-    # Convert to lowercase
-    term = term.lower()
-    
-    # Remove all whitespace
-    term = re.sub(r'\s+', '', term)
-    
-    # Canonicalize by removing underscores (converts snake_case to a standard form)
-    term = term.replace('_', '')
-    
-    return term
+    # ASCII fast path: lowercase and drop everything but letters and digits in one pass
+    if term.isascii():
+        normalized = term.translate(ASCII_NORMALIZE_TABLE)
+    else:
+        # One pass removes whitespace, special characters and underscores (so snake_case
+        # collapses to the same form as camelCase); lowercasing comes after, as before,
+        # so characters that expand on lowercasing are kept intact
+        normalized = NON_ALNUM_PATTERN.sub('', term).lower()
+    
+    # Intern so a term shared by the reference and many runs is a single object,
+    # which keeps memory at the vocabulary size and lets set lookups match by identity
+    return sys.intern(normalized)
 
 
-def extract_terms_from_csv(file_path: Path) -> Set[str]:
+def read_term_column(file_path: Path) -> List[str]:
     """
-    Extract and normalize terms from a CSV file.
+    Read the raw, stripped values of the term column from a CSV file.
     
-    Handles multiple column naming conventions:
-    - 'Term', 'term', 'TERM'
+    The file is parsed with csv.reader, which splits each record in C, and the
+    term column is located once from the header row (case-insensitive) so rows
+    are indexed by position instead of being turned into dicts.
     
     Args:
         file_path: Path to the CSV file
         
     Returns:
-        Set of normalized term strings
+        List of non-empty term values, in file order
     """
-    terms = set()
-    
     with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
         
         # Find the term column (case-insensitive)
-        term_column = None
-        if reader.fieldnames:
-            for col in reader.fieldnames:
+        term_index = None
+        if fieldnames:
+            for index, col in enumerate(fieldnames):
                 if col.lower().strip() == 'term':
-                    term_column = col
+                    term_index = index
                     break
         
-        if term_column is None:
+        if term_index is None:
             raise ValueError(f"Could not find 'term' column in {file_path}. "
-                           f"Available columns: {reader.fieldnames}")
+                           f"Available columns: {fieldnames}")
+        
+        terms = [row[term_index].strip() for row in reader if len(row) > term_index]
+    
+    return [term for term in terms if term]
+
+
+def extract_terms_from_csv(file_path: Path) -> Set[str]:
+    """
+    Extract and normalize terms from a CSV file.
+    
+    Handles multiple column naming conventions:
+    - 'Term', 'term', 'TERM'
+    
+    Args:
+        file_path: Path to the CSV file
         
-        for row in reader:
-            term = row.get(term_column, '').strip()
-            if term:
-                normalized = normalize_term(term)
-                if normalized:
-                    terms.add(normalized)
+    Returns:
+        Set of normalized term strings
+    """
+    terms = {normalize_term(term) for term in read_term_column(file_path)}
+    terms.discard("")
     
     return terms
 
@@ -124,29 +145,8 @@ def extract_terms_with_original(file_path: Path) -> Dict[str, str]:
     Returns:
         Dictionary mapping normalized term to original term
     """
-    terms = {}
-    
-    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        
-        # Find the term column (case-insensitive)
-        term_column = None
-        if reader.fieldnames:
-            for col in reader.fieldnames:
-                if col.lower().strip() == 'term':
-                    term_column = col
-                    break
-        
-        if term_column is None:
-            raise ValueError(f"Could not find 'term' column in {file_path}. "
-                           f"Available columns: {reader.fieldnames}")
-        
-        for row in reader:
-            term = row.get(term_column, '').strip()
-            if term:
-                normalized = normalize_term(term)
-                if normalized:
-                    terms[normalized] = term
+    terms = {normalize_term(term): term for term in read_term_column(file_path)}
+    terms.pop("", None)
     
     return terms
 
@@ -166,23 +166,29 @@ def calculate_metrics(reference: Set[str], evaluated: Set[str],
     Returns:
         MetricResult with calculated metrics
     """
-    tp_normalized = reference & evaluated  # True Positives
-    fp_normalized = evaluated - reference  # False Positives
-    fn_normalized = reference - evaluated  # False Negatives
-    
-    # Map back to original terms if mappings provided
     if reference_original and evaluated_original:
-        tp_terms = {evaluated_original.get(t, t) for t in tp_normalized}
-        fp_terms = {evaluated_original.get(t, t) for t in fp_normalized}
-        fn_terms = {reference_original.get(t, t) for t in fn_normalized}
+        # Classify and map back to original terms in one pass over each set, instead of
+        # building the normalized TP/FP/FN sets first and then mapping each of them
+        tp = 0
+        tp_terms = set()  # True Positives
+        fp_terms = set()  # False Positives
+        for t in evaluated:
+            if t in reference:
+                tp += 1
+                tp_terms.add(evaluated_original.get(t, t))
+            else:
+                fp_terms.add(evaluated_original.get(t, t))
+        fn_terms = {reference_original.get(t, t) for t in reference if t not in evaluated}  # False Negatives
     else:
-        tp_terms = tp_normalized
-        fp_terms = fp_normalized
-        fn_terms = fn_normalized
+        tp_terms = reference & evaluated  # True Positives
+        fp_terms = evaluated - reference  # False Positives
+        fn_terms = reference - evaluated  # False Negatives
+        tp = len(tp_terms)
     
-    tp = len(tp_normalized)
-    fp = len(fp_normalized)
-    fn = len(fn_normalized)
+    # Counts are over the normalized terms: each evaluated term is either a TP or an FP,
+    # and each reference term either a TP or an FN
+    fp = len(evaluated) - tp
+    fn = len(reference) - tp
     
     precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
     recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
@@ -202,7 +208,9 @@ def calculate_metrics(reference: Set[str], evaluated: Set[str],
 
 
 def compare_csv_files(reference_path: Path, model_path: Path, 
-                      file_type: str = "terms") -> Dict:
+                      file_type: str = "terms",
+                      reference_original: Dict[str, str] = None,
+                      include_details: bool = True) -> Dict:
     """
     Compare two CSV files and calculate metrics.
     
@@ -210,26 +218,46 @@ def compare_csv_files(reference_path: Path, model_path: Path,
         reference_path: Path to the reference CSV file
         model_path: Path to the model CSV file
         file_type: Label for this comparison (e.g., "terms", "scored_terms")
+        reference_original: Optional pre-extracted reference mapping (from
+            extract_terms_with_original), so callers comparing many models
+            against the same reference only parse it once
+        include_details: Whether to include the sorted matched/false positive/false
+            negative term lists; callers that only need the metrics can skip them,
+            which also skips building and applying the original-term mappings
+            (format_results then leaves out the term lists)
         
     Returns:
         Dictionary containing comparison results
     """
-    # Extract terms with original mappings
-    reference_original = extract_terms_with_original(reference_path)
-    model_original = extract_terms_with_original(model_path)
-    
-    reference_terms = set(reference_original.keys())
-    model_terms = set(model_original.keys())
-    
-    # Calculate metrics
-    metrics = calculate_metrics(
-        reference_terms, 
-        model_terms,
-        reference_original,
-        model_original
-    )
+    # The original-term mappings are only needed for the details. Without details, the
+    # model is read as a plain set and the TP/FP/FN terms stay normalized.
+    if include_details:
+        # Extract terms with original mappings
+        if reference_original is None:
+            reference_original = extract_terms_with_original(reference_path)
+        model_original = extract_terms_with_original(model_path)
+        
+        reference_terms = set(reference_original.keys())
+        model_terms = set(model_original.keys())
+        
+        # Calculate metrics
+        metrics = calculate_metrics(
+            reference_terms, 
+            model_terms,
+            reference_original,
+            model_original
+        )
+    else:
+        if reference_original is None:
+            reference_terms = extract_terms_from_csv(reference_path)
+        else:
+            reference_terms = set(reference_original.keys())
+        model_terms = extract_terms_from_csv(model_path)
+        
+        # Calculate metrics
+        metrics = calculate_metrics(reference_terms, model_terms)
     
-    return {
+    result = {
         "file_type": file_type,
         "reference_path": str(reference_path),
         "model_path": str(model_path),
@@ -242,13 +270,17 @@ def compare_csv_files(reference_path: Path, model_path: Path,
             "true_positives": metrics.true_positives,
             "false_positives": metrics.false_positives,
             "false_negatives": metrics.false_negatives
-        },
-        "details": {
+        }
+    }
+    
+    if include_details:
+        result["details"] = {
             "matched_terms": sorted(metrics.tp_terms),
             "false_positives": sorted(metrics.fp_terms),
             "false_negatives": sorted(metrics.fn_terms)
         }
-    }
+    
+    return result
 
 
 def format_results(results: Dict) -> str:
@@ -276,7 +308,10 @@ def format_results(results: Dict) -> str:
         output_lines.append(f"  False Positives: {metrics['false_positives']}")
         output_lines.append(f"  False Negatives: {metrics['false_negatives']}")
         
-        details = comparison["details"]
+        # Term lists are only present when the comparison includes the details
+        details = comparison.get("details")
+        if details is None:
+            continue
         output_lines.append(f"\nMatched Terms ({len(details['matched_terms'])}):")
         for term in details["matched_terms"]:
             output_lines.append(f"  + {term}")
@@ -295,6 +330,10 @@ def format_results(results: Dict) -> str:
 
 
 def main():
+    # Only needed on the command line, not when imported by the table generators
+    import argparse
+    import json
+    
     parser = argparse.ArgumentParser(
         description="Compare terms from CSV files and calculate precision, recall, and F1-score."
     )
@@ -64,15 +64,22 @@ def generate_markdown_table():
             print(f"Error: Model file not found: {model_path}")
             return 1
     
-    # Run comparison
-    results = compare_models(reference_path, model_paths)
+    # Run comparison; only the metrics are printed, so the difference lists are skipped
+    results = compare_models(reference_path, model_paths, include_differences=False)
     
-    # Generate markdown table
-    print("## Model Comparison Results\n")
-    print(f"**Reference Model:** `{reference_path.relative_to(data_dir.parent)}`\n")
-    print(f"- Classes: {results['reference_stats']['classes']}")
-    print(f"- Relationships: {results['reference_stats']['relationships']}")
-    print(f"- Attributes: {results['reference_stats']['attributes']}\n")
+    # Mean metrics per element type, computed once and shared by the tables and the summary
+    means = {
+        metric_type: compute_mean_metrics(results["comparisons"], metric_type)
+        for metric_type in ("classes", "relationships", "attributes", "overall")
+    }
+    
+    # Generate markdown table; rows are collected and written in one call
+    out = []
+    out.append("## Model Comparison Results\n")
+    out.append(f"**Reference Model:** `{reference_path.relative_to(data_dir.parent)}`\n")
+    out.append(f"- Classes: {results['reference_stats']['classes']}")
+    out.append(f"- Relationships: {results['reference_stats']['relationships']}")
+    out.append(f"- Attributes: {results['reference_stats']['attributes']}\n")
     
     # Compute average model stats across all runs
     n_models = len(results["comparisons"])
@@ -80,73 +87,71 @@ def generate_markdown_table():
     avg_relationships = sum(comp["model_stats"]["relationships"] for comp in results["comparisons"]) / n_models
     avg_attributes = sum(comp["model_stats"]["attributes"] for comp in results["comparisons"]) / n_models
     
-    print("**Average Model Statistics (across all runs):**\n")
-    print(f"- Classes: {avg_classes:.1f}")
-    print(f"- Relationships: {avg_relationships:.1f}")
-    print(f"- Attributes: {avg_attributes:.1f}\n")
+    out.append("**Average Model Statistics (across all runs):**\n")
+    out.append(f"- Classes: {avg_classes:.1f}")
+    out.append(f"- Relationships: {avg_relationships:.1f}")
+    out.append(f"- Attributes: {avg_attributes:.1f}\n")
     
     # Classes metrics table
-    print("### Classes\n")
-    print("| Run | Precision | Recall | F1-Score | TP | FP | FN |")
-    print("|-----|-----------|--------|----------|----|----|-----|")
+    out.append("### Classes\n")
+    out.append("| Run | Precision | Recall | F1-Score | TP | FP | FN |")
+    out.append("|-----|-----------|--------|----------|----|----|-----|")
     for comp in results["comparisons"]:
         run_name = Path(comp["model_path"]).parent.name
         m = comp["metrics"]["classes"]
-        print(f"| {run_name} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} |")
-    mean = compute_mean_metrics(results["comparisons"], "classes")
-    print(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} |")
-    print()
+        out.append(f"| {run_name} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} |")
+    mean = means["classes"]
+    out.append(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} |")
+    out.append("")
     
     # Relationships metrics table
-    print("### Relationships\n")
-    print("| Run | Precision | Recall | F1-Score | TP | FP | FN |")
-    print("|-----|-----------|--------|----------|----|----|-----|")
+    out.append("### Relationships\n")
+    out.append("| Run | Precision | Recall | F1-Score | TP | FP | FN |")
+    out.append("|-----|-----------|--------|----------|----|----|-----|")
     for comp in results["comparisons"]:
         run_name = Path(comp["model_path"]).parent.name
         m = comp["metrics"]["relationships"]
-        print(f"| {run_name} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} |")
-    mean = compute_mean_metrics(results["comparisons"], "relationships")
-    print(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} |")
-    print()
+        out.append(f"| {run_name} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} |")
+    mean = means["relationships"]
+    out.append(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} |")
+    out.append("")
     
     # Attributes metrics table
-    print("### Attributes\n")
-    print("| Run | Precision | Recall | F1-Score | TP | FP | FN |")
-    print("|-----|-----------|--------|----------|----|----|-----|")
+    out.append("### Attributes\n")
+    out.append("| Run | Precision | Recall | F1-Score | TP | FP | FN |")
+    out.append("|-----|-----------|--------|----------|----|----|-----|")
     for comp in results["comparisons"]:
         run_name = Path(comp["model_path"]).parent.name
         m = comp["metrics"]["attributes"]
-        print(f"| {run_name} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} |")
-    mean = compute_mean_metrics(results["comparisons"], "attributes")
-    print(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} |")
-    print()
+        out.append(f"| {run_name} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} |")
+    mean = means["attributes"]
+    out.append(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} |")
+    out.append("")
     
     # Overall metrics table
-    print("### Overall\n")
-    print("| Run | Precision | Recall | F1-Score | TP | FP | FN |")
-    print("|-----|-----------|--------|----------|----|----|-----|")
+    out.append("### Overall\n")
+    out.append("| Run | Precision | Recall | F1-Score | TP | FP | FN |")
+    out.append("|-----|-----------|--------|----------|----|----|-----|")
     for comp in results["comparisons"]:
         run_name = Path(comp["model_path"]).parent.name
         m = comp["metrics"]["overall"]
-        print(f"| {run_name} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} |")
-    mean = compute_mean_metrics(results["comparisons"], "overall")
-    print(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} |")
-    print()
+        out.append(f"| {run_name} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} |")
+    mean = means["overall"]
+    out.append(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} |")
+    out.append("")
     
     # Summary table (just F1 scores for quick comparison)
-    print("### Summary (F1-Scores)\n")
-    print("| Run | Classes | Relationships | Attributes | Overall |")
-    print("|-----|---------|---------------|------------|---------|")
+    out.append("### Summary (F1-Scores)\n")
+    out.append("| Run | Classes | Relationships | Attributes | Overall |")
+    out.append("|-----|---------|---------------|------------|---------|")
     for comp in results["comparisons"]:
         run_name = Path(comp["model_path"]).parent.name
         m = comp["metrics"]
-        print(f"| {run_name} | {m['classes']['f1_score']:.4f} | {m['relationships']['f1_score']:.4f} | {m['attributes']['f1_score']:.4f} | {m['overall']['f1_score']:.4f} |")
-    # Compute means for summary
-    mean_classes = compute_mean_metrics(results["comparisons"], "classes")
-    mean_rels = compute_mean_metrics(results["comparisons"], "relationships")
-    mean_attrs = compute_mean_metrics(results["comparisons"], "attributes")
-    mean_overall = compute_mean_metrics(results["comparisons"], "overall")
-    print(f"| **Mean** | **{mean_classes['f1_score']:.4f}** | **{mean_rels['f1_score']:.4f}** | **{mean_attrs['f1_score']:.4f}** | **{mean_overall['f1_score']:.4f}** |")
+        out.append(f"| {run_name} | {m['classes']['f1_score']:.4f} | {m['relationships']['f1_score']:.4f} | {m['attributes']['f1_score']:.4f} | {m['overall']['f1_score']:.4f} |")
+    # Means for summary, shared with the tables above
+    out.append(f"| **Mean** | **{means['classes']['f1_score']:.4f}** | **{means['relationships']['f1_score']:.4f}** | **{means['attributes']['f1_score']:.4f}** | **{means['overall']['f1_score']:.4f}** |")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     return 0
 
@@ -9,13 +9,22 @@ Usage:
     python generate_terms_comparison_table.py
 """
 
+import os
 import sys
 from pathlib import Path
 
 # Add scripts directory to path for import
 sys.path.insert(0, str(Path(__file__).parent))
 
-from compare_terms_csv import compare_csv_files
+from compare_terms_csv import compare_csv_files, extract_terms_with_original
+
+# Runs are compared in worker processes only once their terms.csv and scored_terms.csv
+# files add up to this many bytes; the published runs compare serially in milliseconds
+PARALLEL_MIN_BYTES = 1 << 20
+# Files compared in each run directory
+RUN_FILES = ("terms.csv", "scored_terms.csv")
+# Reference paths and parsed terms used by compare_run, stored by set_references
+REFERENCES = {}
 
 
 def compute_mean_metrics(comparisons):
@@ -41,6 +50,62 @@ def compute_mean_metrics(comparisons):
     return {key: val / n for key, val in totals.items()}
 
 
+def set_references(ref_terms_path, ref_terms_original, ref_scored_terms_path, ref_scored_original):
+    """
+    Store the baseline references used by compare_run in this process.
+    
+    Also used as the worker initializer, so each worker receives the parsed
+    references once instead of with every run.
+    
+    Args:
+        ref_terms_path: Path to the reference terms.csv
+        ref_terms_original: Pre-extracted reference terms.csv mapping
+        ref_scored_terms_path: Path to the reference scored_terms.csv
+        ref_scored_original: Pre-extracted reference scored_terms.csv mapping
+    """
+    REFERENCES.update(
+        terms_path=ref_terms_path,
+        terms_original=ref_terms_original,
+        scored_terms_path=ref_scored_terms_path,
+        scored_original=ref_scored_original
+    )
+
+
+def compare_run(run_dir):
+    """
+    Compare one run's terms.csv and scored_terms.csv against the references
+    stored by set_references.
+    
+    Args:
+        run_dir: Directory of the run
+        
+    Returns:
+        Tuple of (terms result, scored_terms result); a result is None when the
+        run does not have that file
+    """
+    run_name = run_dir.name
+    
+    # Compare terms.csv. Missing files are detected by opening them rather than
+    # checking first, which saves a stat call per file.
+    try:
+        terms_result = compare_csv_files(REFERENCES["terms_path"], run_dir / "terms.csv", "terms",
+                                         REFERENCES["terms_original"], include_details=False)
+        terms_result["run_name"] = run_name
+    except FileNotFoundError:
+        terms_result = None
+    
+    # Compare scored_terms.csv
+    try:
+        scored_result = compare_csv_files(REFERENCES["scored_terms_path"], run_dir / "scored_terms.csv",
+                                          "scored_terms", REFERENCES["scored_original"],
+                                          include_details=False)
+        scored_result["run_name"] = run_name
+    except FileNotFoundError:
+        scored_result = None
+    
+    return terms_result, scored_result
+
+
 def generate_markdown_table():
     """Generate a markdown table comparing all runs against the baseline."""
     
@@ -55,8 +120,13 @@ def generate_markdown_table():
     ref_terms_path = baseline_dir / "terms.csv"
     ref_scored_terms_path = baseline_dir / "scored_terms.csv"
     
-    # Find all run directories
-    run_dirs = sorted(llm_mas_dir.glob("run_*"))
+    # Find all run directories with a single directory listing
+    try:
+        with os.scandir(llm_mas_dir) as entries:
+            run_dirs = sorted(Path(entry.path) for entry in entries
+                              if entry.name.startswith("run_") and entry.is_dir())
+    except FileNotFoundError:
+        run_dirs = []
     
     # Validate reference files exist
     if not ref_terms_path.exists():
@@ -67,40 +137,54 @@ def generate_markdown_table():
         print(f"Error: Reference file not found: {ref_scored_terms_path}")
         return 1
     
+    # Parse each reference once and share it across all runs
+    ref_terms_original = extract_terms_with_original(ref_terms_path)
+    ref_scored_original = extract_terms_with_original(ref_scored_terms_path)
+    
+    # Compare runs in worker processes when there is enough data: each run is independent.
+    # Each worker receives the parsed references once, through the pool initializer.
+    references = (ref_terms_path, ref_terms_original, ref_scored_terms_path, ref_scored_original)
+    run_bytes = 0
+    for run_dir in run_dirs:
+        with os.scandir(run_dir) as entries:
+            run_bytes += sum(entry.stat().st_size for entry in entries if entry.name in RUN_FILES)
+    max_workers = min(len(run_dirs), os.cpu_count() or 1)
+    if max_workers > 1 and run_bytes >= PARALLEL_MIN_BYTES:
+        # Imported only on this path, which the published runs never reach
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=set_references,
+                                 initargs=references) as executor:
+            run_results = list(executor.map(compare_run, run_dirs))
+    else:
+        set_references(*references)
+        run_results = [compare_run(run_dir) for run_dir in run_dirs]
+    
     # Collect comparisons
     terms_comparisons = []
     scored_terms_comparisons = []
     
-    for run_dir in run_dirs:
-        run_name = run_dir.name
-        
-        # Compare terms.csv
-        terms_path = run_dir / "terms.csv"
-        if terms_path.exists():
-            result = compare_csv_files(ref_terms_path, terms_path, "terms")
-            result["run_name"] = run_name
-            terms_comparisons.append(result)
+    for run_dir, (terms_result, scored_result) in zip(run_dirs, run_results):
+        if terms_result is not None:
+            terms_comparisons.append(terms_result)
         else:
-            print(f"Warning: {terms_path} not found")
+            print(f"Warning: {run_dir / 'terms.csv'} not found")
         
-        # Compare scored_terms.csv
-        scored_terms_path = run_dir / "scored_terms.csv"
-        if scored_terms_path.exists():
-            result = compare_csv_files(ref_scored_terms_path, scored_terms_path, "scored_terms")
-            result["run_name"] = run_name
-            scored_terms_comparisons.append(result)
+        if scored_result is not None:
+            scored_terms_comparisons.append(scored_result)
         else:
-            print(f"Warning: {scored_terms_path} not found")
+            print(f"Warning: {run_dir / 'scored_terms.csv'} not found")
     
-    # Get reference counts
-    ref_terms_result = compare_csv_files(ref_terms_path, ref_terms_path, "terms")
-    ref_scored_result = compare_csv_files(ref_scored_terms_path, ref_scored_terms_path, "scored_terms")
+    # Mean metrics, computed once and shared by the tables and the summary
+    mean_terms = compute_mean_metrics(terms_comparisons)
+    mean_scored = compute_mean_metrics(scored_terms_comparisons)
     
-    # Generate markdown output
-    print("## Terms CSV Comparison Results\n")
-    print(f"**Reference (Manual Baseline):**")
-    print(f"- `terms.csv`: {ref_terms_result['reference_count']} terms")
-    print(f"- `scored_terms.csv`: {ref_scored_result['reference_count']} terms\n")
+    # Generate markdown output; rows are collected and written in one call
+    out = []
+    out.append("## Terms CSV Comparison Results\n")
+    out.append(f"**Reference (Manual Baseline):**")
+    out.append(f"- `terms.csv`: {len(ref_terms_original)} terms")
+    out.append(f"- `scored_terms.csv`: {len(ref_scored_original)} terms\n")
     
     # Compute average terms across all runs
     if terms_comparisons:
@@ -113,55 +197,55 @@ def generate_markdown_table():
     else:
         avg_scored_terms = 0
     
-    print("**Average Model Statistics (across all runs):**\n")
-    print(f"- `terms.csv`: {avg_terms:.1f} terms")
-    print(f"- `scored_terms.csv`: {avg_scored_terms:.1f} terms\n")
+    out.append("**Average Model Statistics (across all runs):**\n")
+    out.append(f"- `terms.csv`: {avg_terms:.1f} terms")
+    out.append(f"- `scored_terms.csv`: {avg_scored_terms:.1f} terms\n")
     
     # Terms.csv metrics table
-    print("### terms.csv Comparison\n")
-    print("| Run | Precision | Recall | F1-Score | TP | FP | FN | Model Terms |")
-    print("|-----|-----------|--------|----------|----|----|-----|-------------|")
+    out.append("### terms.csv Comparison\n")
+    out.append("| Run | Precision | Recall | F1-Score | TP | FP | FN | Model Terms |")
+    out.append("|-----|-----------|--------|----------|----|----|-----|-------------|")
     for comp in terms_comparisons:
         m = comp["metrics"]
-        print(f"| {comp['run_name']} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} | {comp['model_count']} |")
+        out.append(f"| {comp['run_name']} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} | {comp['model_count']} |")
     
     if terms_comparisons:
-        mean = compute_mean_metrics(terms_comparisons)
+        mean = mean_terms
         mean_model_count = sum(c['model_count'] for c in terms_comparisons) / len(terms_comparisons)
-        print(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} | {mean_model_count:.1f} |")
-    print()
+        out.append(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} | {mean_model_count:.1f} |")
+    out.append("")
     
     # Scored_terms.csv metrics table
-    print("### scored_terms.csv Comparison\n")
-    print("| Run | Precision | Recall | F1-Score | TP | FP | FN | Model Terms |")
-    print("|-----|-----------|--------|----------|----|----|-----|-------------|")
+    out.append("### scored_terms.csv Comparison\n")
+    out.append("| Run | Precision | Recall | F1-Score | TP | FP | FN | Model Terms |")
+    out.append("|-----|-----------|--------|----------|----|----|-----|-------------|")
     for comp in scored_terms_comparisons:
         m = comp["metrics"]
-        print(f"| {comp['run_name']} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} | {comp['model_count']} |")
+        out.append(f"| {comp['run_name']} | {m['precision']:.4f} | {m['recall']:.4f} | {m['f1_score']:.4f} | {m['true_positives']} | {m['false_positives']} | {m['false_negatives']} | {comp['model_count']} |")
     
     if scored_terms_comparisons:
-        mean = compute_mean_metrics(scored_terms_comparisons)
+        mean = mean_scored
         mean_model_count = sum(c['model_count'] for c in scored_terms_comparisons) / len(scored_terms_comparisons)
-        print(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} | {mean_model_count:.1f} |")
-    print()
+        out.append(f"| **Mean** | **{mean['precision']:.4f}** | **{mean['recall']:.4f}** | **{mean['f1_score']:.4f}** | {mean['true_positives']:.1f} | {mean['false_positives']:.1f} | {mean['false_negatives']:.1f} | {mean_model_count:.1f} |")
+    out.append("")
     
     # Summary table (F1-Scores comparison)
-    print("### Summary (F1-Scores)\n")
-    print("| Run | terms.csv | scored_terms.csv |")
-    print("|-----|-----------|------------------|")
+    out.append("### Summary (F1-Scores)\n")
+    out.append("| Run | terms.csv | scored_terms.csv |")
+    out.append("|-----|-----------|------------------|")
     for i, terms_comp in enumerate(terms_comparisons):
         run_name = terms_comp['run_name']
         terms_f1 = terms_comp['metrics']['f1_score']
         scored_f1 = scored_terms_comparisons[i]['metrics']['f1_score'] if i < len(scored_terms_comparisons) else "N/A"
         if isinstance(scored_f1, float):
-            print(f"| {run_name} | {terms_f1:.4f} | {scored_f1:.4f} |")
+            out.append(f"| {run_name} | {terms_f1:.4f} | {scored_f1:.4f} |")
         else:
-            print(f"| {run_name} | {terms_f1:.4f} | {scored_f1} |")
+            out.append(f"| {run_name} | {terms_f1:.4f} | {scored_f1} |")
     
     if terms_comparisons and scored_terms_comparisons:
-        mean_terms = compute_mean_metrics(terms_comparisons)
-        mean_scored = compute_mean_metrics(scored_terms_comparisons)
-        print(f"| **Mean** | **{mean_terms['f1_score']:.4f}** | **{mean_scored['f1_score']:.4f}** |")
+        out.append(f"| **Mean** | **{mean_terms['f1_score']:.4f}** | **{mean_scored['f1_score']:.4f}** |")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     return 0
 